@@ -2,18 +2,23 @@
 # ArXiv论文追踪与分析器
 
 import os
+import asyncio
+import html
+import json
+import re
+import sqlite3
 import arxiv
 import datetime
 from pathlib import Path
-from openai import OpenAI
+from dataclasses import dataclass
+from openai import AsyncOpenAI
 import time
 import logging
 import sys
-import smtplib
+import aiosmtplib
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from dotenv import load_dotenv
-from jinja2 import Template
 import functools  # ✅ 新增：用于注入 timeout
 
 # 加载环境变量
@@ -36,21 +41,38 @@ SMTP_PASSWORD = os.getenv("SMTP_PASSWORD")
 EMAIL_FROM = os.getenv("EMAIL_FROM")
 EMAIL_TO = [email.strip() for email in os.getenv("EMAIL_TO", "").split(",") if email.strip()]
 
-PAPERS_DIR = Path("./papers")
 CONCLUSION_FILE = Path("./conclusion.md")
+PAPERS_DB = Path("./papers.db")  # 已分析论文索引，按 arxiv short_id 去重
 CATEGORIES = ["cs.MA", "cs.AI"]
 MAX_PAPERS = 88
+ANALYSIS_CONCURRENCY = 10  # 同时进行的 DeepSeek 请求数上限（限流）
+ANALYSIS_BATCH_SIZE = 8  # 每次 DeepSeek 请求最多合并分析的论文数
+ANALYSIS_MAX_TOKENS_PER_PAPER = 800  # 每篇论文的输出 token 上限，批量请求按篇数累加
+ANALYSIS_FAILED_TEXT = "**论文分析出错**: 分析失败，详见运行日志"  # 分析失败时在报告中显示的文本
+
+
+def validate_config():
+    """启动时检查必需的配置，缺失时立即报错，避免分析完所有论文后才发现无法调用 API 或发送邮件"""
+    required = {
+        "DEEPSEEK_API_KEY": DEEPSEEK_API_KEY,
+        "SMTP_SERVER": SMTP_SERVER,
+        "SMTP_USERNAME": SMTP_USERNAME,
+        "SMTP_PASSWORD": SMTP_PASSWORD,
+        "EMAIL_FROM": EMAIL_FROM,
+        "EMAIL_TO": EMAIL_TO,
+    }
+    missing = [name for name, value in required.items() if not value]
+    if missing:
+        raise RuntimeError(f"配置不完整，缺少环境变量: {', '.join(missing)}")
+
+
+def make_deepseek_client():
+    """创建 DeepSeek 异步客户端（openai 1.x 写法）；需在 validate_config() 之后调用，缺少 API key 时构造会直接报错"""
+    return AsyncOpenAI(
+        api_key=DEEPSEEK_API_KEY,
+        base_url="https://api.deepseek.com/v1",
+    )
 
-# 配置 DeepSeek 客户端（openai 1.x 写法）
-client = OpenAI(
-    api_key=DEEPSEEK_API_KEY,
-    base_url="https://api.deepseek.com/v1",
-)
-
-# 如果不存在论文目录则创建
-PAPERS_DIR.mkdir(exist_ok=True)
-logger.info(f"论文将保存在: {PAPERS_DIR.absolute()}")
-logger.info(f"分析结果将写入: {CONCLUSION_FILE.absolute()}")
 
 # ✅ 修改1：给 arxiv.Client 内部请求注入 timeout，避免请求无限挂死
 def make_arxiv_client(page_size: int, delay_seconds: float, num_retries: int, timeout=(5, 30)) -> arxiv.Client:
@@ -74,8 +96,32 @@ def make_arxiv_client(page_size: int, delay_seconds: float, num_retries: int, ti
     return c
 
 
+@dataclass(slots=True)
+class PaperMeta:
+    """论文元信息，在拿到 arxiv 结果时一次性格式化好，后续分析/写文件/发邮件直接复用"""
+    short_id: str
+    title: str
+    authors_str: str
+    cats_str: str
+    published: datetime.datetime
+    published_str: str
+    url: str
+
+    @classmethod
+    def from_arxiv(cls, paper):
+        return cls(
+            short_id=paper.get_short_id(),
+            title=paper.title,
+            authors_str=", ".join(author.name for author in paper.authors),
+            cats_str=", ".join(paper.categories),
+            published=paper.published,
+            published_str=paper.published.strftime('%Y-%m-%d'),
+            url=paper.entry_id,
+        )
+
+
 def get_recent_papers(categories, max_results=MAX_PAPERS):
-    """获取最近5天内发布的指定类别的论文"""
+    """获取最近5天内发布的指定类别的论文，返回 PaperMeta 列表"""
     today = datetime.datetime.now()
     five_days_ago = today - datetime.timedelta(days=5)
     start_date = five_days_ago.strftime("%Y%m%d")
@@ -88,7 +134,7 @@ def get_recent_papers(categories, max_results=MAX_PAPERS):
 
     # ✅ 仅替换这一段：用 make_arxiv_client 注入 timeout
     arxiv_client = make_arxiv_client(
-        page_size=min(max_results, 50),
+        page_size=min(max_results, 100),  # MAX_PAPERS 不超过100时一页取完，省去翻页和限流等待
         delay_seconds=3,  # 你原来是多少就保持多少
         num_retries=5,    # 你原来是多少就保持多少
         timeout=(5, 30),   # ✅ 新增：强制超时，避免卡死
@@ -104,86 +150,181 @@ def get_recent_papers(categories, max_results=MAX_PAPERS):
     # 首次请求前等待一下，避免被限流（保持不动）
     time.sleep(5)
 
-    results = list(arxiv_client.results(search))
+    results = [PaperMeta.from_arxiv(paper) for paper in arxiv_client.results(search)]
     logger.info(f"找到{len(results)}篇符合条件的论文")
     return results
 
 
 
-def download_paper(paper, output_dir):
-    """将论文PDF下载到指定目录"""
-    pdf_path = output_dir / f"{paper.get_short_id().replace('/', '_')}.pdf"
+def open_paper_index(db_path=PAPERS_DB):
+    """打开（必要时创建）已分析论文的 SQLite 索引"""
+    conn = sqlite3.connect(db_path)
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS papers("
+        "id TEXT PRIMARY KEY, title TEXT, published TEXT, analysis TEXT, analyzed_at INTEGER)"
+    )
+    return conn
 
-    if pdf_path.exists():
-        logger.info(f"论文已下载: {pdf_path}")
-        return pdf_path
 
-    try:
-        logger.info(f"正在下载: {paper.title}")
-        paper.download_pdf(filename=str(pdf_path))
-        logger.info(f"已下载到 {pdf_path}")
-        return pdf_path
-    except Exception as e:
-        logger.error(f"下载论文失败 {paper.title}: {str(e)}")
-        return None
+def filter_new_papers(conn, papers):
+    """过滤掉索引中已经分析过的论文"""
+    new_papers = [
+        paper for paper in papers
+        if not conn.execute("SELECT 1 FROM papers WHERE id=?", (paper.short_id,)).fetchone()
+    ]
+    logger.info(f"跳过{len(papers) - len(new_papers)}篇已分析过的论文")
+    return new_papers
+
+
+def save_analyses(conn, papers_analyses):
+    """在一个事务中把分析结果写入索引；分析失败（analysis 为 None）的论文不记录，下次运行会重试"""
+    now = int(time.time())
+    rows = [
+        (paper.short_id, paper.title, paper.published.isoformat(), analysis, now)
+        for paper, analysis in papers_analyses
+        if analysis is not None
+    ]
+    with conn:
+        conn.executemany("INSERT OR REPLACE INTO papers VALUES (?, ?, ?, ?, ?)", rows)
+    logger.info(f"已记录{len(rows)}篇论文到 {PAPERS_DB}")
 
 
-def analyze_paper_with_deepseek(pdf_path, paper):
-    """使用 DeepSeek API 分析论文（openai 1.x 写法）"""
+def parse_batch_analyses(content, batch_size):
+    """
+    解析批量分析返回的 JSON，逐条校验，返回长度为 batch_size 的分析文本列表。
+    单条格式无效（不是对象、index 缺失/越界、analysis 不是非空字符串）只跳过该条，
+    不影响同一批中其他论文；缺失或无效的位置为 None
+    """
+    analyses = [None] * batch_size
+    data = json.loads(content)
+    items = data.get("analyses") if isinstance(data, dict) else None
+    if not isinstance(items, list):
+        logger.error("批量结果中没有 analyses 列表")
+        return analyses
+
+    for item in items:
+        if not isinstance(item, dict):
+            logger.error(f"跳过格式无效的批量结果条目: {item!r}")
+            continue
+        index = item.get("index")
+        # bool 是 int 的子类，需要单独排除
+        if isinstance(index, bool) or not isinstance(index, int) or not 1 <= index <= batch_size:
+            logger.error(f"跳过 index 无效的批量结果条目: {index!r}")
+            continue
+        analysis = item.get("analysis")
+        # 模型可能把 analysis 返回成对象或 null，只接受非空字符串
+        if not isinstance(analysis, str) or not analysis.strip():
+            logger.error(f"跳过 analysis 无效的批量结果条目: index={index}")
+            continue
+        if analyses[index - 1] is not None:
+            logger.warning(f"批量结果中 index={index} 重复，保留第一条")
+            continue
+        analyses[index - 1] = analysis
+
+    return analyses
+
+
+async def analyze_papers_batch(client, papers_batch):
+    """
+    使用 DeepSeek API 在一次请求中批量分析多篇论文，返回与输入顺序一致的分析文本列表，
+    分析失败的论文对应位置为 None
+    """
+    titles = ", ".join(paper.title for paper in papers_batch)
     try:
-        author_names = [author.name for author in paper.authors]
+        sections = []
+        for i, paper in enumerate(papers_batch, 1):
+            sections.append(f"""
+        [论文 {i}]
+        论文标题: {paper.title}
+        作者: {paper.authors_str}
+        类别: {paper.cats_str}
+        发布时间: {paper.published_str}
+        """)
 
         prompt = f"""
-        论文标题: {paper.title}
-        作者: {', '.join(author_names)}
-        类别: {', '.join(paper.categories)}
-        发布时间: {paper.published}
-        
-        请分析这篇研究论文并提供：
+        分析以下 {len(papers_batch)} 篇论文：
+        {''.join(sections)}
+        请分别分析每篇研究论文并提供：
         1. 简明摘要（3-5句话）
         2. 主要贡献和创新点
         3. 研究方法，具体采用的技术，工具，数据集
         4. 实验结果，包括数据集，实验设置，实验结果，实验结论
         5. 对领域的潜在影响
         6. 局限性或未来工作方向
-        
-        请使用中文回答，并以纯文本，分自然段格式输出。
+
+        请使用中文回答，每篇论文的分析以纯文本，分自然段格式书写，控制在500字以内。
+        以 JSON 格式返回：{{"analyses": [{{"index": 论文编号, "analysis": "分析内容"}}, ...]}}，
+        数组中按编号顺序包含全部 {len(papers_batch)} 篇论文。
         """
 
-        logger.info(f"正在分析论文: {paper.title}")
-        response = client.chat.completions.create(
+        logger.info(f"正在批量分析 {len(papers_batch)} 篇论文: {titles}")
+        response = await client.chat.completions.create(
             model="deepseek-chat",
             messages=[
-                {"role": "system", "content": "你是一位专门总结和分析学术论文的研究助手。请使用中文回复。"},
+                {"role": "system", "content": "你是学术论文分析助手，用中文回复。"},
                 {"role": "user", "content": prompt},
-            ]
+            ],
+            response_format={"type": "json_object"},
+            max_tokens=ANALYSIS_MAX_TOKENS_PER_PAPER * len(papers_batch),
+            temperature=0.3,
+            stream=True,
         )
 
-        analysis = response.choices[0].message.content
-        logger.info(f"论文分析完成: {paper.title}")
-        return analysis
+        # 流式接收：连接持续有数据，不会在长时间生成时因读超时断开；
+        # 最后一个分片带有 finish_reason，用来判断输出是否被截断
+        parts = []
+        finish_reason = None
+        async for chunk in response:
+            if chunk.choices:
+                parts.append(chunk.choices[0].delta.content or "")
+                finish_reason = chunk.choices[0].finish_reason or finish_reason
+
+        if finish_reason == "length":
+            # 输出达到 max_tokens 被截断，JSON 不完整；拆成两半重试，避免一篇长回答拖垮整批
+            if len(papers_batch) == 1:
+                logger.error(f"论文分析输出达到 max_tokens 上限被截断: {titles}")
+                return [None]
+            logger.warning(f"批量分析输出达到 max_tokens 上限被截断，拆分为更小的批次重试: {titles}")
+            half = len(papers_batch) // 2
+            return (
+                await analyze_papers_batch(client, papers_batch[:half])
+                + await analyze_papers_batch(client, papers_batch[half:])
+            )
+
+        analyses = parse_batch_analyses("".join(parts), len(papers_batch))
+        for paper, analysis in zip(papers_batch, analyses):
+            if analysis is None:
+                logger.error(f"批量结果中缺少该论文或格式无效: {paper.title}")
+        logger.info(f"批量分析完成: {titles}")
+        return analyses
     except Exception as e:
-        logger.error(f"分析论文失败 {paper.title}: {str(e)}")
-        return f"**论文分析出错**: {str(e)}"
+        logger.error(f"批量分析论文失败 {titles}: {str(e)}")
+        return [None] * len(papers_batch)
+
+
+def format_paper_section(paper, analysis):
+    """把单篇论文的元信息和分析结果格式化为一段 markdown，analysis 为 None 时显示失败提示"""
+    return "".join([
+        f"### {paper.title}\n",
+        f"**作者**: {paper.authors_str}\n",
+        f"**类别**: {paper.cats_str}\n",
+        f"**发布日期**: {paper.published_str}\n",
+        f"**链接**: {paper.url}\n\n",
+        f"{analysis if analysis is not None else ANALYSIS_FAILED_TEXT}\n\n",
+        "---\n\n",
+    ])
 
 
 def write_to_conclusion(papers_analyses):
     """将分析结果写入conclusion.md"""
     today = datetime.datetime.now().strftime('%Y-%m-%d')
 
-    with open(CONCLUSION_FILE, 'a', encoding='utf-8') as f:
-        f.write(f"\n\n## ArXiv论文 - 最近5天 (截至 {today})\n\n")
+    parts = [f"\n\n## ArXiv论文 - 最近5天 (截至 {today})\n\n"]
+    parts.extend(format_paper_section(paper, analysis) for paper, analysis in papers_analyses)
 
-        for paper, analysis in papers_analyses:
-            author_names = [author.name for author in paper.authors]
-
-            f.write(f"### {paper.title}\n")
-            f.write(f"**作者**: {', '.join(author_names)}\n")
-            f.write(f"**类别**: {', '.join(paper.categories)}\n")
-            f.write(f"**发布日期**: {paper.published.strftime('%Y-%m-%d')}\n")
-            f.write(f"**链接**: {paper.entry_id}\n\n")
-            f.write(f"{analysis}\n\n")
-            f.write("---\n\n")
+    # 整份内容一次写入；大缓冲区保证不会被 TextIOWrapper 拆成多次 write 系统调用
+    with open(CONCLUSION_FILE, 'a', encoding='utf-8', buffering=1 << 20) as f:
+        f.write("".join(parts))
 
     logger.info(f"分析结果已写入 {CONCLUSION_FILE}")
 
@@ -191,110 +332,156 @@ def write_to_conclusion(papers_analyses):
 def format_email_content(papers_analyses):
     """格式化邮件内容"""
     today = datetime.datetime.now().strftime('%Y-%m-%d')
-    content = f"## 今日ArXiv论文分析报告 ({today})\n\n"
-
-    for paper, analysis in papers_analyses:
-        author_names = [author.name for author in paper.authors]
 
-        content += f"### {paper.title}\n"
-        content += f"**作者**: {', '.join(author_names)}\n"
-        content += f"**类别**: {', '.join(paper.categories)}\n"
-        content += f"**发布日期**: {paper.published.strftime('%Y-%m-%d')}\n"
-        content += f"**链接**: {paper.entry_id}\n\n"
-        content += f"{analysis}\n\n"
-        content += "---\n\n"
-
-    return content
-
-
-def delete_pdf(pdf_path):
-    """删除PDF文件"""
-    try:
-        if pdf_path.exists():
-            pdf_path.unlink()
-            logger.info(f"已删除PDF文件: {pdf_path}")
-    except Exception as e:
-        logger.error(f"删除PDF文件失败 {pdf_path}: {str(e)}")
+    parts = [f"## 今日ArXiv论文分析报告 ({today})\n\n"]
+    parts.extend(format_paper_section(paper, analysis) for paper, analysis in papers_analyses)
+
+    return "".join(parts)
+
+
+# 邮件 HTML 外壳，正文直接拼接在 HTML_HEAD 和 HTML_TAIL 之间
+HTML_HEAD = """
+<html>
+<head>
+    <meta charset="UTF-8">
+    <style>
+        body{font-family:-apple-system,BlinkMacSystemFont,'Segoe UI',Roboto,'Helvetica Neue',Arial,sans-serif;line-height:1.6;max-width:1000px;margin:0 auto;padding:20px;background-color:#f5f5f5;}
+        .container{background-color:white;padding:30px;border-radius:8px;box-shadow:0 2px 4px rgba(0,0,0,0.1);}
+        h1{color:#2c3e50;border-bottom:2px solid #3498db;padding-bottom:10px;}
+        h2{color:#34495e;margin-top:40px;padding-bottom:8px;border-bottom:1px solid #eee;}
+        h3{color:#2980b9;margin-top:30px;}
+        a{color:#3498db;text-decoration:none;}
+        hr{border:none;border-top:1px solid #eee;margin:30px 0;}
+    </style>
+</head>
+<body>
+    <div class="container">
+"""
+HTML_TAIL = """
+    </div>
+</body>
+</html>
+"""
+
+# 报告中用到的 markdown 标记：标题、分隔线、加粗、换行，用一个正则一次扫描完成全部替换
+_MD_RE = re.compile(
+    r"^(?P<hashes>#{2,3}) (?P<text>[^\n]*)\n*"
+    r"|^---+[ \t]*(?:\n+|$)"
+    r"|\*\*"
+    r"|\n\n+|\n",
+    re.MULTILINE,
+)
 
 
-def send_email(content):
+def markdown_to_html(content):
+    """
+    把报告中用到的少量 markdown 标记转换为 HTML，其余文本做 HTML 转义。
+    未配对的 ** 会在段落、分隔线或标题处自动闭合，避免加粗蔓延到后续内容
+    """
+    bold_open = False
+
+    def close_bold():
+        nonlocal bold_open
+        if bold_open:
+            bold_open = False
+            return "</strong>"
+        return ""
+
+    def replace(m):
+        nonlocal bold_open
+        token = m.group(0)
+        if token == "**":
+            bold_open = not bold_open
+            return "<strong>" if bold_open else "</strong>"
+        if token == "\n":
+            return "<br>"
+        if m.group("hashes"):
+            level = len(m.group("hashes"))
+            return f"{close_bold()}<h{level}>{m.group('text')}</h{level}>"
+        if token.startswith("-"):
+            return f"{close_bold()}<hr>"
+        return f"{close_bold()}<br><br>"
+
+    html_content = _MD_RE.sub(replace, html.escape(content, quote=False))
+    return html_content + close_bold()
+
+
+async def send_email(content):
     """发送邮件，支持多个收件人"""
-    if not all([SMTP_SERVER, SMTP_PORT, SMTP_USERNAME, SMTP_PASSWORD, EMAIL_FROM]) or not EMAIL_TO:
-        logger.error("邮件配置不完整，跳过发送邮件")
-        return
-
     try:
         msg = MIMEMultipart()
         msg['From'] = EMAIL_FROM
         msg['To'] = ", ".join(EMAIL_TO)
         msg['Subject'] = f"ArXiv论文分析报告 - {datetime.datetime.now().strftime('%Y-%m-%d')}"
 
-        html_template = """
-        <html>
-        <head>
-            <meta charset="UTF-8">
-            <style>
-                body{font-family:-apple-system,BlinkMacSystemFont,'Segoe UI',Roboto,'Helvetica Neue',Arial,sans-serif;line-height:1.6;max-width:1000px;margin:0 auto;padding:20px;background-color:#f5f5f5;}
-                .container{background-color:white;padding:30px;border-radius:8px;box-shadow:0 2px 4px rgba(0,0,0,0.1);}
-                h1{color:#2c3e50;border-bottom:2px solid #3498db;padding-bottom:10px;}
-                h2{color:#34495e;margin-top:40px;padding-bottom:8px;border-bottom:1px solid #eee;}
-                h3{color:#2980b9;margin-top:30px;}
-                a{color:#3498db;text-decoration:none;}
-                hr{border:none;border-top:1px solid #eee;margin:30px 0;}
-            </style>
-        </head>
-        <body>
-            <div class="container">
-                {{ content | safe }}
-            </div>
-        </body>
-        </html>
-        """
-
-        content_html = content.replace("\n\n", "<br><br>").replace("---", "<hr>")
-        template = Template(html_template)
-        html_content = template.render(content=content_html)
+        html_content = HTML_HEAD + markdown_to_html(content) + HTML_TAIL
 
         msg.attach(MIMEText(html_content, 'html'))
 
-        with smtplib.SMTP(SMTP_SERVER, SMTP_PORT) as server:
-            server.starttls()
-            server.login(SMTP_USERNAME, SMTP_PASSWORD)
-            server.send_message(msg)
+        async with aiosmtplib.SMTP(hostname=SMTP_SERVER, port=SMTP_PORT, start_tls=True) as smtp:
+            await smtp.login(SMTP_USERNAME, SMTP_PASSWORD)
+            await smtp.send_message(msg)
 
         logger.info(f"邮件发送成功，收件人: {', '.join(EMAIL_TO)}")
     except Exception as e:
         logger.error(f"发送邮件失败: {str(e)}")
 
 
-def main():
+async def analyze_papers(client, papers):
+    """
+    按 ANALYSIS_BATCH_SIZE 把论文分批，并发调用 DeepSeek 分析，
+    用信号量把同时进行的请求数限制在 ANALYSIS_CONCURRENCY 以内。
+    返回按原始顺序排列的 (paper, analysis) 列表
+    """
+    sem = asyncio.Semaphore(ANALYSIS_CONCURRENCY)
+    batches = [papers[i:i + ANALYSIS_BATCH_SIZE] for i in range(0, len(papers), ANALYSIS_BATCH_SIZE)]
+
+    async def bounded_analyze(batch):
+        async with sem:
+            return await analyze_papers_batch(client, batch)
+
+    batch_analyses = await asyncio.gather(*(bounded_analyze(batch) for batch in batches))
+
+    return [
+        (paper, analysis)
+        for batch, analyses in zip(batches, batch_analyses)
+        for paper, analysis in zip(batch, analyses)
+    ]
+
+
+async def main():
     logger.info("开始ArXiv论文跟踪")
+    validate_config()
+    logger.info(f"分析结果将写入: {CONCLUSION_FILE.absolute()}")
+
+    # arxiv 检索是阻塞的 HTTP 请求，放到后台线程，同时在主线程打开论文索引
+    search_task = asyncio.create_task(asyncio.to_thread(get_recent_papers, CATEGORIES, MAX_PAPERS))
+    conn = open_paper_index()
+    try:
+        papers = await search_task
+        logger.info(f"从最近5天找到{len(papers)}篇论文")
+
+        papers = filter_new_papers(conn, papers)
 
-    papers = get_recent_papers(CATEGORIES, MAX_PAPERS)
-    logger.info(f"从最近5天找到{len(papers)}篇论文")
+        if not papers:
+            logger.info("所选时间段没有找到新论文。退出。")
+            return
 
-    if not papers:
-        logger.info("所选时间段没有找到论文。退出。")
-        return
+        async with make_deepseek_client() as client:
+            papers_analyses = await analyze_papers(client, papers)
 
-    papers_analyses = []
-    for i, paper in enumerate(papers, 1):
-        logger.info(f"正在处理论文 {i}/{len(papers)}: {paper.title}")
-        pdf_path = download_paper(paper, PAPERS_DIR)
-        if pdf_path:
-            time.sleep(2)
-            analysis = analyze_paper_with_deepseek(pdf_path, paper)
-            papers_analyses.append((paper, analysis))
-            delete_pdf(pdf_path)
+        save_analyses(conn, papers_analyses)
+    finally:
+        conn.close()
 
     write_to_conclusion(papers_analyses)
 
     email_content = format_email_content(papers_analyses)
-    send_email(email_content)
+    await send_email(email_content)
 
     logger.info("ArXiv论文追踪和分析完成")
     logger.info(f"结果已保存至 {CONCLUSION_FILE.absolute()}")
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())